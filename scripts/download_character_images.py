@@ -4,16 +4,11 @@ Script pour télécharger les images des personnages Tamagotchi Pix
 depuis mrblinky.net et d'autres sources
 """
 
-import urllib.request
 import urllib.error
 import json
-from pathlib import Path
-import time
 
-# Configurations
-MRBLINKY_BASE = "https://mrblinky.net/tama/pix/download/"
-OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "images" / "characters"
-DATA_FILE = Path(__file__).parent.parent / "public" / "characters-list.html"
+from pix import transport
+from pix.config import CHARACTERS_DIR as OUTPUT_DIR, MRBLINKY_BASE, USER_AGENT
 
 # Mapping des personnages avec leurs noms de fichiers possibles
 CHARACTER_IMAGE_MAP = {
@@ -85,16 +80,15 @@ def download_image(url, filename):
         print(f"  ↓ {filename}...", end=" ", flush=True)
         
         # Télécharger avec timeout
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            content = response.read()
-            
-            # Sauvegarder le fichier
-            with open(filepath, 'wb') as f:
-                f.write(content)
-            
-            print(f"✓ ({len(content)} bytes)")
-            return str(filepath.relative_to(OUTPUT_DIR.parent.parent))
+        response = transport.fetch(url, headers={'User-Agent': USER_AGENT}, timeout=10)
+        content = response.body
+        
+        # Sauvegarder le fichier
+        with open(filepath, 'wb') as f:
+            f.write(content)
+        
+        print(f"✓ ({len(content)} bytes)")
+        return str(filepath.relative_to(OUTPUT_DIR.parent.parent))
             
     except urllib.error.HTTPError as e:
         if e.code == 404:
@@ -132,7 +126,7 @@ def main():
                 download_map[char_name] = result
                 successful += 1
                 found = True
-                time.sleep(0.5)  # Éviter de surcharger le serveur
+                transport.pause(0.5)  # Éviter de surcharger le serveur
                 break
         
         if not found:
@@ -4,14 +4,11 @@ Script pour extraire les images des personnages Tamagotchi Pix
 depuis les sources web et valider les URLs
 """
 
-import urllib.request
 import urllib.error
 import json
-from pathlib import Path
 
-# URLs des sources
-FANDOM_URL = "https://tamagotchi.fandom.com/wiki/Tamagotchi_Pix/Character_list"
-MRBLINKY_BASE = "https://mrblinky.net/tama/pix/download/"
+from pix import transport
+from pix.config import DATA_DIR, MRBLINKY_BASE
 
 # Liste des personnages et leurs images potentielles
 characters = {
@@ -35,8 +32,7 @@ characters = {
 def check_image_url(url):
     """Vérifier si une URL d'image existe"""
     try:
-        req = urllib.request.Request(url, method='HEAD')
-        response = urllib.request.urlopen(req, timeout=5)
+        response = transport.fetch(url, timeout=5, method='HEAD')
         return response.status == 200
     except (urllib.error.URLError, urllib.error.HTTPError, Exception):
         return False
@@ -67,7 +63,8 @@ def find_valid_images():
     
     return results
 
-if __name__ == "__main__":
+def main():
+    """Fonction principale"""
     print("🔍 Extraction des images Tamagotchi Pix...")
     print("=" * 50)
     
@@ -78,8 +75,11 @@ if __name__ == "__main__":
     print(f"  Personnages trouvés: {len([v for v in valid_images.values() if v])}/{len(valid_images)}")
     
     # Sauvegarder les résultats
-    output_file = Path(__file__).parent.parent / "data" / "image-mapping.json"
+    output_file = DATA_DIR / "image-mapping.json"
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(valid_images, f, ensure_ascii=False, indent=2)
     
     print(f"\n✅ Résultats sauvegardés dans: {output_file}")
+
+if __name__ == "__main__":
+    main()
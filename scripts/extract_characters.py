@@ -1,17 +1,33 @@
 #!/usr/bin/env python3
 import json
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict
 
+from pix import transport
+from pix.config import DATA_DIR, FANDOM_URL, PIXFAVOURITES_URL
+
+def extraction_timestamp():
+    """Horodatage de l'extraction; en replay, date de la réponse Fandom enregistrée
+    pour que la sortie soit identique d'une exécution à l'autre"""
+    from datetime import datetime
+    from email.utils import parsedate_to_datetime
+
+    if transport.get_transport().mode != "replay":
+        return datetime.now().isoformat()
+    try:
+        date = transport.fetch(FANDOM_URL).header("Date")
+    except Exception:
+        date = None
+    return parsedate_to_datetime(date).isoformat() if date else None
+
 def extract_fandom_characters() -> List[Dict]:
     """Extraire les personnages du wiki Fandom Tamagotchi Pix"""
-    url = "https://tamagotchi.fandom.com/wiki/Tamagotchi_Pix/Character_list"
+    from bs4 import BeautifulSoup
+
+    url = FANDOM_URL
     
     try:
-        response = requests.get(url, timeout=10)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = transport.fetch(url, timeout=10)
+        soup = BeautifulSoup(response.body, 'html.parser')
         
         characters = []
         
@@ -53,12 +69,13 @@ def extract_fandom_characters() -> List[Dict]:
 
 def extract_pixfavourites() -> List[Dict]:
     """Extraire les personnages du site pixfavourites"""
-    url = "https://pixfavourites.tiddlyhost.com/"
+    from bs4 import BeautifulSoup
+
+    url = PIXFAVOURITES_URL
     
     try:
-        response = requests.get(url, timeout=10)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = transport.fetch(url, timeout=10)
+        soup = BeautifulSoup(response.body, 'html.parser')
         
         characters = []
         
@@ -71,7 +88,8 @@ def extract_pixfavourites() -> List[Dict]:
         print(f"Erreur lors de la récupération de la page pixfavourites: {e}")
         return []
 
-if __name__ == "__main__":
+def main():
+    """Fonction principale"""
     print("📥 Récupération des données du wiki Fandom...")
     fandom_chars = extract_fandom_characters()
     print(f"✓ {len(fandom_chars)} personnages trouvés sur Fandom")
@@ -83,16 +101,19 @@ if __name__ == "__main__":
     # Fusionner et organiser les données
     output = {
         "metadata": {
-            "source": ["https://tamagotchi.fandom.com/wiki/Tamagotchi_Pix/Character_list", "https://pixfavourites.tiddlyhost.com/"],
-            "timestamp": __import__('datetime').datetime.now().isoformat(),
+            "source": [FANDOM_URL, PIXFAVOURITES_URL],
+            "timestamp": extraction_timestamp(),
             "totalCharacters": len(fandom_chars) + len(pixfav_chars)
         },
         "characters": fandom_chars + pixfav_chars
     }
     
     # Sauvegarder en JSON
-    output_path = "/workspaces/Ta-madz-Pix/data/pix-characters-full.json"
+    output_path = DATA_DIR / "pix-characters-full.json"
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
     
     print(f"\n✓ Données sauvegardées dans {output_path}")
+
+if __name__ == "__main__":
+    main()
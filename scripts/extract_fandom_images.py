@@ -4,28 +4,23 @@ Script pour extraire les images des personnages Tamagotchi Pix depuis le Fandom
 et mettre à jour le fichier HTML
 """
 
-import urllib.request
-import urllib.error
 import json
 import re
-from pathlib import Path
 from urllib.parse import urljoin
-import time
 
-FANDOM_URL = "https://tamagotchi.fandom.com/wiki/Tamagotchi_Pix/Character_list"
-OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "images" / "characters"
-HTML_FILE = Path(__file__).parent.parent / "public" / "characters-list.html"
+from pix import transport
+from pix.config import CHARACTERS_DIR as OUTPUT_DIR, FANDOM_URL, USER_AGENT_BROWSER
 
 def fetch_fandom_page():
     """Récupérer la page du Fandom"""
     print("🔍 Récupération de la page Fandom...")
     try:
-        req = urllib.request.Request(
+        response = transport.fetch(
             FANDOM_URL,
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+            headers={'User-Agent': USER_AGENT_BROWSER},
+            timeout=10
         )
-        with urllib.request.urlopen(req, timeout=10) as response:
-            return response.read().decode('utf-8')
+        return response.text()
     except Exception as e:
         print(f"❌ Erreur lors de la récupération: {e}")
         return None
@@ -72,16 +67,15 @@ def download_image(url, filename):
             return str(filepath.relative_to(OUTPUT_DIR.parent.parent))
         
         print(f"  ↓ {filename}...", end=" ", flush=True)
-        req = urllib.request.Request(
+        response = transport.fetch(
             url,
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+            headers={'User-Agent': USER_AGENT_BROWSER},
+            timeout=10
         )
-        with urllib.request.urlopen(req, timeout=10) as response:
-            content = response.read()
-            with open(filepath, 'wb') as f:
-                f.write(content)
-            print(f"✓")
-            return str(filepath.relative_to(OUTPUT_DIR.parent.parent))
+        with open(filepath, 'wb') as f:
+            f.write(response.body)
+        print(f"✓")
+        return str(filepath.relative_to(OUTPUT_DIR.parent.parent))
     except Exception as e:
         print(f"✗ {e}")
         return None
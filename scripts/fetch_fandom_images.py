@@ -3,16 +3,11 @@
 Script pour télécharger les images de personnages Tamagotchi Pix directement depuis Fandom
 """
 
-import urllib.request
-import urllib.error
 import json
 import re
-from pathlib import Path
-import time
 
-FANDOM_URL = "https://tamagotchi.fandom.com/wiki/Tamagotchi_Pix/Character_list"
-OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "images" / "characters"
-HTML_FILE = Path(__file__).parent.parent / "public" / "characters-list.html"
+from pix import transport
+from pix.config import CHARACTERS_DIR as OUTPUT_DIR, FANDOM_URL, USER_AGENT, USER_AGENT_CHROME
 
 # Map des noms de personnages avec variantes
 CHARACTER_NAMES = {
@@ -61,14 +56,12 @@ CHARACTER_NAMES = {
 def fetch_page(url):
     """Récupérer le contenu d'une page"""
     try:
-        req = urllib.request.Request(
+        response = transport.fetch(
             url,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            headers={'User-Agent': USER_AGENT_CHROME},
+            timeout=15
         )
-        with urllib.request.urlopen(req, timeout=15) as response:
-            return response.read().decode('utf-8', errors='ignore')
+        return response.text(errors='ignore')
     except Exception as e:
         print(f"❌ Erreur téléchargement ({url}): {e}")
         return None
@@ -132,18 +125,17 @@ def download_images(image_map):
                 continue
             
             print(f"  ↓ {char_name}...", end=" ", flush=True)
-            req = urllib.request.Request(
+            response = transport.fetch(
                 url,
-                headers={'User-Agent': 'Mozilla/5.0'}
+                headers={'User-Agent': USER_AGENT},
+                timeout=10
             )
             
-            with urllib.request.urlopen(req, timeout=10) as response:
-                content = response.read()
-                with open(filepath, 'wb') as f:
-                    f.write(content)
-                print("✓")
-                downloaded[char_name] = f"assets/images/characters/{filename}"
-                time.sleep(0.3)  # Éviter de surcharger
+            with open(filepath, 'wb') as f:
+                f.write(response.body)
+            print("✓")
+            downloaded[char_name] = f"assets/images/characters/{filename}"
+            transport.pause(0.3)  # Éviter de surcharger
         except Exception as e:
             print(f"✗")
     
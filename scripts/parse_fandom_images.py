@@ -4,12 +4,13 @@ Parser pour extraire les images du wiki Fandom Tamagotchi Pix
 et créer un mapping JSON pour l'application
 """
 
-import urllib.request
 import re
 import json
-from pathlib import Path
 from html.parser import HTMLParser
 
+from pix import transport
+from pix.config import DATA_DIR, FANDOM_URL, USER_AGENT_BROWSER
+
 class FandomImageParser(HTMLParser):
     """Parser HTML pour extraire les images Fandom"""
     
@@ -39,16 +40,16 @@ class FandomImageParser(HTMLParser):
 
 def fetch_fandom_page():
     """Récupérer la page Fandom"""
-    url = "https://tamagotchi.fandom.com/wiki/Tamagotchi_Pix/Character_list"
+    url = FANDOM_URL
     print(f"🌐 Récupération de {url}...")
     
     try:
-        req = urllib.request.Request(
+        response = transport.fetch(
             url,
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+            headers={'User-Agent': USER_AGENT_BROWSER},
+            timeout=15
         )
-        with urllib.request.urlopen(req, timeout=15) as response:
-            return response.read().decode('utf-8', errors='ignore')
+        return response.text(errors='ignore')
     except Exception as e:
         print(f"❌ Erreur: {e}")
         return None
@@ -113,7 +114,7 @@ def main():
         print(f"  • {name}: {url[:60]}...")
     
     # Sauvegarder
-    output_file = Path(__file__).parent.parent / "data" / "fandom-images.json"
+    output_file = DATA_DIR / "fandom-images.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_file, 'w', encoding='utf-8') as f:
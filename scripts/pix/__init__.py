@@ -0,0 +1,3 @@
+"""
+Outils partagés par les scripts Python du pipeline Tamagotchi Pix
+"""
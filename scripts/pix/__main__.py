@@ -0,0 +1,5 @@
+import sys
+
+from pix.cli import main
+
+sys.exit(main())
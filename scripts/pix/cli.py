@@ -0,0 +1,220 @@
+"""
+CLI unifiée du pipeline Tamagotchi Pix
+
+Exécution (depuis scripts/):
+    python3 -m pix <commande> [options]
+
+Chaque sous-commande n'importe son script (et ses dépendances lourdes:
+bs4, réseau, ...) qu'au moment de son exécution, pour que les commandes
+rapides (index, check) démarrent en moins de STARTUP_BUDGET_MS.
+"""
+
+import argparse
+import sys
+
+from pix.config import SCRIPTS_DIR
+
+STARTUP_BUDGET_MS = 100
+
+
+def _run_script(module_name):
+    """Importer un script du dossier scripts/ et exécuter son main()"""
+    import importlib
+
+    module = importlib.import_module(module_name)
+    module.main()
+    return 0
+
+
+def _run_node(*script_names):
+    """Exécuter des scripts Node du dossier scripts/ à la suite"""
+    import subprocess
+
+    for script_name in script_names:
+        result = subprocess.run(["node", str(SCRIPTS_DIR / script_name)])
+        if result.returncode != 0:
+            return result.returncode
+    return 0
+
+
+def cmd_fetch(args):
+    return _run_script("parse_fandom_images")
+
+
+def cmd_extract(args):
+    return _run_script("extract_fandom_images" if args.images else "extract_characters")
+
+
+def cmd_download(args):
+    return _run_script("fetch_fandom_images" if args.source == "fandom" else "download_character_images")
+
+
+def cmd_optimize(args):
+    return _run_node("compress-and-optimize-images.js")
+
+
+def cmd_index(args):
+    from pix import manifest
+
+    entries = manifest.build_manifest()
+    for filename, entry in entries.items():
+        print(f"{entry['name']:<32} {entry['bytes']:>8}  {filename}")
+    print(f"\n{len(entries)} images")
+
+    if args.write:
+        manifest.save_manifest(manifest.refresh_manifest())
+        print(f"✅ Manifeste sauvegardé: {manifest.MANIFEST_FILE}")
+    return 0
+
+
+def cmd_placeholders(args):
+    from pix import placeholders
+
+    return placeholders.main(force=args.force)
+
+
+def cmd_recommend(args):
+    from pix import recommendations
+
+    recommendations.main(k=args.k, metric=args.metric)
+    return 0
+
+
+def cmd_verify(args):
+    from pix import verify
+
+    return verify.main(workers=args.workers, use_cache=not args.no_cache)
+
+
+def cmd_bundle(args):
+    if not args.skip_verify:
+        from pix import verify
+
+        # Une image invalide ne doit pas atteindre le bundle embarqué
+        if verify.main(workers=args.workers) != 0:
+            print("❌ Bundle annulé: corriger les images ci-dessus (ou --skip-verify)")
+            return 1
+    return _run_node("embed-images.js", "generate_local_image_map.js")
+
+
+def cmd_check(args):
+    from pix import manifest
+
+    found = manifest.find_character(args.name)
+    for path in found:
+        print(f"  ✓ {path.name} ({path.stat().st_size} bytes)")
+
+    if args.remote:
+        from pix.config import MRBLINKY_BASE
+        from download_character_images import CHARACTER_IMAGE_MAP
+        from extract_character_images import check_image_url
+
+        for filename in CHARACTER_IMAGE_MAP.get(args.name, [f"{args.name.lower()}.png"]):
+            url = MRBLINKY_BASE + filename
+            print(f"  {'✓' if check_image_url(url) else '✗'} {url}")
+
+    if not found:
+        print(f"  ⚠ Aucune image locale pour {args.name}")
+        return 1
+    return 0
+
+
+def cmd_budget(args):
+    """Mesurer le démarrage des commandes rapides (`index`, `check`) avec -X importtime"""
+    import subprocess
+    import time
+
+    failed = False
+    for command_args in (["index"], ["check", args.name]):
+        label = " ".join(command_args)
+        command = [sys.executable, "-X", "importtime", "-m", "pix", *command_args]
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=SCRIPTS_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        # Lignes: "import time: self [us] | cumulative | imported package"
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            _, cumulative, package = line[len("import time:"):].split("|")
+            if not package.startswith("  "):
+                imports.append((int(cumulative), package.strip()))
+
+        print(f"Démarrage de `pix {label}`: {elapsed_ms:.0f} ms (budget {args.budget_ms} ms)")
+        for cumulative, package in sorted(imports, reverse=True)[:args.top]:
+            print(f"  {cumulative / 1000:>7.1f} ms  {package}")
+
+        if result.returncode != 0:
+            print(f"❌ `pix {label}` a échoué (code {result.returncode})")
+            failed = True
+        elif elapsed_ms > args.budget_ms:
+            print("❌ Budget de démarrage dépassé")
+            failed = True
+        print()
+    return 1 if failed else 0
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"doit être >= 1: {value}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="pix", description="Pipeline des images et données Tamagotchi Pix")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("fetch", help="récupérer les URLs d'images du wiki Fandom").set_defaults(func=cmd_fetch)
+
+    extract = commands.add_parser("extract", help="extraire les personnages du wiki Fandom")
+    extract.add_argument("--images", action="store_true", help="extraire les images plutôt que les personnages")
+    extract.set_defaults(func=cmd_extract)
+
+    download = commands.add_parser("download", help="télécharger les images des personnages")
+    download.add_argument("--source", choices=("mrblinky", "fandom"), default="mrblinky")
+    download.set_defaults(func=cmd_download)
+
+    commands.add_parser("optimize", help="compresser les images (core / extra)").set_defaults(func=cmd_optimize)
+
+    index = commands.add_parser("index", help="lister le manifeste des images locales")
+    index.add_argument("--write", action="store_true", help="sauvegarder le manifeste JSON")
+    index.set_defaults(func=cmd_index)
+
+    placeholders = commands.add_parser("placeholders", help="calculer couleurs et BlurHash des images")
+    placeholders.add_argument("--force", action="store_true", help="ignorer le cache sha256")
+    placeholders.set_defaults(func=cmd_placeholders)
+
+    recommend = commands.add_parser("recommend", help="calculer personnages similaires et listes objet -> personnages")
+    recommend.add_argument("-k", type=int, default=8, help="nombre de voisins par personnage")
+    recommend.add_argument("--metric", choices=("jaccard", "cosine"), default="jaccard")
+    recommend.set_defaults(func=cmd_recommend)
+
+    verify = commands.add_parser("verify", help="vérifier l'intégrité des images (signature, décodage, sha256)")
+    verify.add_argument("--workers", type=_positive_int, default=None, help="nombre de processus (défaut: nombre de CPU)")
+    verify.add_argument("--no-cache", action="store_true", help="revérifier tous les fichiers")
+    verify.set_defaults(func=cmd_verify)
+
+    bundle = commands.add_parser("bundle", help="vérifier les images puis générer les fichiers TypeScript embarqués")
+    bundle.add_argument("--skip-verify", action="store_true", help="ne pas vérifier les images avant le bundle")
+    bundle.add_argument("--workers", type=_positive_int, default=None, help="nombre de processus pour la vérification")
+    bundle.set_defaults(func=cmd_bundle)
+
+    check = commands.add_parser("check", help="vérifier les images d'un personnage")
+    check.add_argument("name")
+    check.add_argument("--remote", action="store_true", help="vérifier aussi les URLs mrblinky")
+    check.set_defaults(func=cmd_check)
+
+    budget = commands.add_parser("budget", help="mesurer le temps de démarrage de la CLI")
+    budget.add_argument("--budget-ms", type=int, default=STARTUP_BUDGET_MS)
+    budget.add_argument("--top", type=int, default=10, help="nombre d'imports les plus lents affichés")
+    budget.add_argument("--name", default="Mametchi", help="personnage utilisé pour mesurer `check`")
+    budget.set_defaults(func=cmd_budget)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,36 @@
+"""
+Configuration partagée du pipeline: sources distantes, chemins et user agents
+
+Ce module ne doit importer que la bibliothèque standard légère:
+il est chargé par toutes les commandes de la CLI, y compris les plus rapides.
+"""
+
+from pathlib import Path
+
+# Chemins du dépôt
+ROOT_DIR = Path(__file__).parent.parent.parent
+SCRIPTS_DIR = ROOT_DIR / "scripts"
+DATA_DIR = ROOT_DIR / "data"
+IMAGES_DIR = ROOT_DIR / "assets" / "images"
+CHARACTERS_DIR = IMAGES_DIR / "characters"
+HTML_FILE = ROOT_DIR / "public" / "characters-list.html"
+
+CHARACTERS_DATA_FILE = DATA_DIR / "tamagotchi-pix-characters-full.json"
+ITEMS_DATA_FILE = DATA_DIR / "tamagotchi-items.ts"
+IMAGE_MAPPING_FILE = IMAGES_DIR / "character-images-mapping.json"
+HTTP_ARCHIVE_DIR = DATA_DIR / "http-archive"
+
+# Sources distantes
+FANDOM_URL = "https://tamagotchi.fandom.com/wiki/Tamagotchi_Pix/Character_list"
+MRBLINKY_BASE = "https://mrblinky.net/tama/pix/download/"
+PIXFAVOURITES_URL = "https://pixfavourites.tiddlyhost.com/"
+
+# User agents
+USER_AGENT = "Mozilla/5.0"
+USER_AGENT_BROWSER = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+USER_AGENT_CHROME = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".gif")
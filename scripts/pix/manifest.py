@@ -0,0 +1,86 @@
+"""
+Manifeste des images de personnages présentes dans assets/images/characters
+"""
+
+import hashlib
+import json
+import re
+
+from pix.config import CHARACTERS_DIR, DATA_DIR, IMAGE_EXTENSIONS
+
+MANIFEST_FILE = DATA_DIR / "character-images-manifest.json"
+
+
+def character_key(filename):
+    """Nom de personnage déduit d'un nom de fichier (même règle que les scripts Node)"""
+    stem = filename.rsplit(".", 1)[0]
+    stem = re.sub(r"\s*\(\d+\)\s*", "", stem)
+    words = re.sub(r"[-_]", " ", stem).split(" ")
+    return " ".join(word[:1].upper() + word[1:].lower() for word in words if word)
+
+
+def list_character_images(directory=CHARACTERS_DIR):
+    """Fichiers image du dossier des personnages, triés par nom"""
+    if not directory.exists():
+        return []
+    return sorted(
+        path for path in directory.iterdir()
+        if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS
+    )
+
+
+def build_manifest(directory=CHARACTERS_DIR):
+    """Entrées du manifeste: nom de fichier -> nom du personnage et taille"""
+    manifest = {}
+    for path in list_character_images(directory):
+        manifest[path.name] = {
+            "name": character_key(path.name),
+            "bytes": path.stat().st_size,
+        }
+    return manifest
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def refresh_manifest(directory=CHARACTERS_DIR, path=MANIFEST_FILE):
+    """Manifeste à jour avec sha256; les champs calculés par les autres étapes
+    (placeholder, ...) sont conservés pour les fichiers dont le contenu n'a pas changé"""
+    previous = load_manifest(path)
+    current = build_manifest(directory)
+    for filename, entry in current.items():
+        entry["sha256"] = file_sha256(directory / filename)
+        cached = previous.get(filename, {})
+        if cached.get("sha256") == entry["sha256"]:
+            for key, value in cached.items():
+                entry.setdefault(key, value)
+    return current
+
+
+def load_manifest(path=MANIFEST_FILE):
+    """Manifeste sauvegardé, ou dictionnaire vide"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_character(name, directory=CHARACTERS_DIR):
+    """Images correspondant à un personnage (comparaison insensible à la casse)"""
+    wanted = name.replace(" ", "").lower()
+    return [
+        path for path in list_character_images(directory)
+        if character_key(path.name).replace(" ", "").lower().startswith(wanted)
+    ]
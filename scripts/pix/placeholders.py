@@ -0,0 +1,165 @@
+"""
+Couleurs de remplacement et BlurHash des images de personnages
+
+Toutes les images sont réduites à une grille PLACEHOLDER_SIZE x PLACEHOLDER_SIZE
+puis traitées en un seul passage NumPy (couleur moyenne, couleur dominante,
+composantes BlurHash). Les résultats sont écrits dans le manifeste
+(data/character-images-manifest.json) et réutilisés tant que le sha256 du
+fichier ne change pas.
+
+Dépendances: numpy, Pillow (avec support WebP)
+"""
+
+from pix import manifest
+from pix.config import CHARACTERS_DIR
+
+PLACEHOLDER_SIZE = 32
+BLURHASH_COMPONENTS = (4, 3)  # (x, y)
+# Fond de l'app sur lequel les sprites transparents sont composés
+BACKGROUND_RGB = (255, 255, 255)
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def _require_imaging():
+    """Importer numpy et Pillow, avec un message clair s'ils manquent"""
+    try:
+        import numpy as np
+        from PIL import Image
+    except ImportError as e:
+        raise SystemExit(f"❌ Dépendance manquante ({e.name}): pip install numpy Pillow")
+    return np, Image
+
+
+def _base83(value, length):
+    return "".join(BASE83[(value // 83 ** (length - i - 1)) % 83] for i in range(length))
+
+
+def _hex(rgb):
+    return "#{:02x}{:02x}{:02x}".format(*(int(c) for c in rgb))
+
+
+def load_thumbnails(paths):
+    """Décoder et réduire les images en un tableau (N, S, S, 4) de float32 dans [0, 1]
+
+    Retourne (lot, chemins décodés, erreurs {chemin: message}); une image
+    illisible est écartée du lot sans interrompre le traitement des autres."""
+    np, Image = _require_imaging()
+    thumbnails, loaded, errors = [], [], {}
+    for path in paths:
+        try:
+            with Image.open(path) as img:
+                img = img.convert("RGBA").resize((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.BILINEAR)
+                thumbnails.append(np.asarray(img, dtype=np.float32) / 255.0)
+        except Exception as e:
+            errors[path] = f"{type(e).__name__}: {e}"
+            continue
+        loaded.append(path)
+
+    batch = np.empty((len(thumbnails), PLACEHOLDER_SIZE, PLACEHOLDER_SIZE, 4), dtype=np.float32)
+    for i, thumbnail in enumerate(thumbnails):
+        batch[i] = thumbnail
+    return batch, loaded, errors
+
+
+def compute_placeholders(batch):
+    """Couleurs moyenne / dominante et BlurHash pour chaque image du lot"""
+    np, _ = _require_imaging()
+    n, height, width, _ = batch.shape
+    rgb, alpha = batch[..., :3], batch[..., 3:]
+
+    # Couleur moyenne pondérée par l'alpha (les pixels transparents ne comptent pas)
+    weight = alpha.reshape(n, -1, 1)
+    total = np.maximum(weight.sum(axis=1), 1e-6)
+    average = (rgb.reshape(n, -1, 3) * weight).sum(axis=1) / total * 255.0
+
+    # Couleur dominante: histogramme 4 bits par canal des pixels opaques
+    quantized = (rgb * 15.0 + 0.5).astype(np.int64).reshape(n, -1, 3)
+    codes = quantized[..., 0] * 256 + quantized[..., 1] * 16 + quantized[..., 2]
+    opaque = alpha.reshape(n, -1) >= 0.5
+    offsets = (np.arange(n) * 4096)[:, None]
+    counts = np.bincount((codes + offsets)[opaque], minlength=n * 4096).reshape(n, 4096)
+    dominant_codes = counts.argmax(axis=1)
+    dominant = np.stack([dominant_codes // 256, (dominant_codes // 16) % 16, dominant_codes % 16], axis=1) * 17
+    dominant = np.where(opaque.any(axis=1)[:, None], dominant, average)
+
+    # BlurHash: composition sur le fond puis projection sur la base cosinus
+    background = np.asarray(BACKGROUND_RGB, dtype=np.float32) / 255.0
+    composed = rgb * alpha + background * (1.0 - alpha)
+    linear = np.where(composed <= 0.04045, composed / 12.92, ((composed + 0.055) / 1.055) ** 2.4)
+
+    cx, cy = BLURHASH_COMPONENTS
+    basis_x = np.cos(np.pi * np.arange(cx)[:, None] * np.arange(width)[None, :] / width)
+    basis_y = np.cos(np.pi * np.arange(cy)[:, None] * np.arange(height)[None, :] / height)
+    factors = np.einsum("jh,iw,nhwc->njic", basis_y, basis_x, linear) / (width * height)
+    factors[:, 1:, :, :] *= 2.0
+    factors[:, 0, 1:, :] *= 2.0
+    factors = factors.reshape(n, cx * cy, 3)
+
+    blurhashes = [_encode_blurhash(np, f, cx, cy) for f in factors]
+    return [
+        {"average": _hex(average[i]), "dominant": _hex(dominant[i]), "blurhash": blurhashes[i]}
+        for i in range(n)
+    ]
+
+
+def _linear_to_srgb(np, value):
+    v = np.clip(value, 0.0, 1.0)
+    srgb = np.where(v <= 0.0031308, v * 12.92, 1.055 * v ** (1 / 2.4) - 0.055)
+    return (srgb * 255.0 + 0.5).astype(np.int64)
+
+
+def _encode_blurhash(np, factors, cx, cy):
+    """Encoder les composantes (DC + AC) d'une image au format BlurHash"""
+    dc, ac = factors[0], factors[1:]
+    result = _base83((cx - 1) + (cy - 1) * 9, 1)
+
+    if len(ac):
+        actual_max = float(np.abs(ac).max())
+        quantised_max = int(max(0, min(82, int(actual_max * 166 - 0.5))))
+        maximum = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        maximum = 1.0
+        result += _base83(0, 1)
+
+    r, g, b = (int(c) for c in _linear_to_srgb(np, dc))
+    result += _base83((r << 16) + (g << 8) + b, 4)
+
+    scaled = ac / maximum
+    quantised = np.clip(np.floor(np.sign(scaled) * np.abs(scaled) ** 0.5 * 9 + 9.5), 0, 18).astype(np.int64)
+    for qr, qg, qb in quantised:
+        result += _base83(int(qr) * 361 + int(qg) * 19 + int(qb), 2)
+    return result
+
+
+def update_manifest(directory=CHARACTERS_DIR, force=False):
+    """Calculer les placeholders des images nouvelles ou modifiées et sauvegarder le manifeste"""
+    current = manifest.refresh_manifest(directory)
+    pending = [
+        filename for filename, entry in current.items()
+        if force or "placeholder" not in entry
+    ]
+
+    errors = {}
+    if pending:
+        batch, loaded, failures = load_thumbnails([directory / filename for filename in pending])
+        errors = {path.name: message for path, message in failures.items()}
+        if loaded:
+            for path, placeholder in zip(loaded, compute_placeholders(batch)):
+                current[path.name]["placeholder"] = placeholder
+
+    manifest.save_manifest(current)
+    return current, [filename for filename in pending if filename not in errors], errors
+
+
+def main(force=False):
+    """Fonction principale; retourne le code de sortie (1 si une image est illisible)"""
+    print("🎨 Calcul des placeholders (couleurs + BlurHash)...")
+    entries, computed, errors = update_manifest(force=force)
+    for filename, message in errors.items():
+        print(f"  ✗ {filename}: {message}")
+    cached = len(entries) - len(computed) - len(errors)
+    print(f"  ✓ {len(computed)} image(s) traitée(s), {cached} depuis le cache, {len(errors)} illisible(s)")
+    print(f"\n✅ Manifeste sauvegardé: {manifest.MANIFEST_FILE}")
+    return 1 if errors else 0
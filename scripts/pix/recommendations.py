@@ -0,0 +1,223 @@
+"""
+Tables de recommandation précalculées à partir de data/tamagotchi-pix-characters-full.json
+
+- similar    : pour chaque personnage, les k personnages les plus proches
+               (Jaccard ou cosinus sur personnalité, traits, goûts et rareté)
+- itemLikers : pour chaque objet du catalogue (id "catégorie-code" de
+               data/tamagotchi-items.ts), les personnages qui l'aiment
+
+Les goûts sont du texte libre en anglais ("Books", "Cake"); ils sont normalisés
+(minuscules, sans accents, singulier) puis rattachés aux objets du catalogue dont
+le nom de sprite anglais ou le nom français contient tous leurs mots. Les ids de
+personnages suivent la règle de data/tamagotchi-characters.ts (id, sinon tama-<index>).
+
+Les attributs sont encodés en matrice binaire compactée (np.packbits); les
+intersections sont calculées par blocs de lignes (produit matriciel), sans
+boucle Python quadratique.
+
+Dépendances: numpy
+"""
+
+import json
+import re
+import unicodedata
+
+from pix.config import CHARACTERS_DATA_FILE, DATA_DIR, ITEMS_DATA_FILE
+
+OUTPUT_FILE = DATA_DIR / "character-recommendations.json"
+DEFAULT_K = 8
+METRICS = ("jaccard", "cosine")
+# Lignes traitées par produit matriciel (limite la mémoire à BLOCK_SIZE x N)
+BLOCK_SIZE = 512
+
+# Catégories du catalogue correspondant aux goûts alimentaires (likesFood / favoriteFood)
+FOOD_CATEGORIES = ("meals", "snacks")
+STOP_WORDS = {"a", "an", "and", "of", "the", "au", "aux", "d", "de", "des", "du", "en", "l", "la", "le", "les"}
+MAKE_ITEM_PATTERN = re.compile(r'makeItem\("([^"]*)",\s*"(\w+)",\s*"(\d+)",\s*"(\d+)",\s*"([^"]*)"\)')
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise SystemExit(f"❌ Dépendance manquante ({e.name}): pip install numpy")
+    return np
+
+
+def _singular(word):
+    if len(word) > 3 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("es") and word[-3] in "sxz":
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def normalize_words(text):
+    """Mots normalisés d'un libellé: minuscules, sans accents ni mots vides, au singulier"""
+    ascii_text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii").lower()
+    return frozenset(_singular(w) for w in re.findall(r"[a-z0-9]+", ascii_text) if w not in STOP_WORDS)
+
+
+def normalize_token(text):
+    """Forme canonique d'un libellé ("Books" et "book" donnent "book")"""
+    return " ".join(sorted(normalize_words(text)))
+
+
+def character_id(character, index):
+    """Même règle que data/tamagotchi-characters.ts: id, sinon tama-<index>"""
+    return str(character["id"]) if character.get("id") else f"tama-{index}"
+
+
+def load_item_catalog(path=ITEMS_DATA_FILE):
+    """Objets du catalogue: liste de (id, catégorie, mots normalisés du nom et du sprite)"""
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    catalog = []
+    for name, category, category_code, item_code, sprite in MAKE_ITEM_PATTERN.findall(source):
+        # "58-3-course-meal.png" -> "3 course meal"
+        english = re.sub(r"^\d+-", "", sprite.rsplit(".", 1)[0]).replace("-", " ")
+        catalog.append((f"{category_code}-{item_code}", category, normalize_words(english) | normalize_words(name)))
+    return catalog
+
+
+def match_catalog(label, catalog, food):
+    """Ids des objets du catalogue correspondant à un goût en texte libre"""
+    words = normalize_words(label)
+    if not words:
+        return []
+    return [
+        item_id for item_id, category, item_words in catalog
+        if (category in FOOD_CATEGORIES) == food and words <= item_words
+    ]
+
+
+def character_features(character, catalog=()):
+    """Attributs d'un personnage sous forme de jetons préfixés ("trait:friendly", "catalog:00-58", ...)"""
+    preferences = character.get("preferences") or {}
+    evolution = character.get("evolution") or {}
+
+    foods = list(preferences.get("likesFood") or [])
+    items = list(preferences.get("likesItems") or [])
+    if preferences.get("favoriteFood"):
+        foods.append(preferences["favoriteFood"])
+    if preferences.get("favoriteItem"):
+        items.append(preferences["favoriteItem"])
+
+    tokens = set()
+    for prefix, values in (
+        ("personality", character.get("personality") or []),
+        ("trait", character.get("traits") or []),
+        ("food", foods),
+        ("item", items),
+        ("rarity", [evolution["rarity"]] if evolution.get("rarity") else []),
+    ):
+        tokens.update(f"{prefix}:{normalize_token(v)}" for v in values if normalize_token(v))
+
+    # Objets du catalogue: ids explicites et goûts rattachés au catalogue
+    tokens.update(f"catalog:{item_id}" for item_id in preferences.get("favoriteItemIds") or [])
+    for food, values in ((True, foods), (False, items)):
+        for value in values:
+            tokens.update(f"catalog:{item_id}" for item_id in match_catalog(value, catalog, food))
+    return tokens
+
+
+def encode_features(characters, catalog=()):
+    """Matrice binaire compactée (N, ceil(V / 8)) et vocabulaire trié des jetons"""
+    np = _require_numpy()
+    rows = [character_features(c, catalog) for c in characters]
+    vocabulary = sorted(set().union(*rows)) if rows else []
+    column = {token: j for j, token in enumerate(vocabulary)}
+
+    dense = np.zeros((len(rows), len(vocabulary)), dtype=bool)
+    row_index = [i for i, tokens in enumerate(rows) for _ in tokens]
+    col_index = [column[token] for tokens in rows for token in tokens]
+    dense[row_index, col_index] = True
+    return np.packbits(dense, axis=1), vocabulary
+
+
+def top_k_neighbours(packed, n_features, k=DEFAULT_K, metric="jaccard"):
+    """Indices et scores des k plus proches voisins de chaque ligne (hors elle-même)"""
+    np = _require_numpy()
+    if metric not in METRICS:
+        raise ValueError(f"Métrique inconnue: {metric} (attendu: {', '.join(METRICS)})")
+
+    features = np.unpackbits(packed, axis=1, count=n_features).astype(np.float32)
+    n = features.shape[0]
+    k = min(k, max(n - 1, 0))
+    sizes = features.sum(axis=1)
+
+    indices = np.empty((n, k), dtype=np.int64)
+    scores = np.empty((n, k), dtype=np.float32)
+    for start in range(0, n, BLOCK_SIZE):
+        stop = min(start + BLOCK_SIZE, n)
+        intersection = features[start:stop] @ features.T
+        if metric == "jaccard":
+            union = sizes[start:stop, None] + sizes[None, :] - intersection
+            sims = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+        else:
+            norms = np.sqrt(sizes[start:stop, None] * sizes[None, :])
+            sims = np.divide(intersection, norms, out=np.zeros_like(intersection), where=norms > 0)
+        sims[np.arange(stop - start), np.arange(start, stop)] = -1.0
+
+        # Tri stable: à score égal, l'ordre du fichier source est conservé
+        order = np.argsort(-sims, axis=1, kind="stable")[:, :k]
+        indices[start:stop] = order
+        scores[start:stop] = np.take_along_axis(sims, order, axis=1)
+    return indices, scores
+
+
+def inverted_lists(packed, n_features, vocabulary, prefix, order):
+    """Jeton -> indices des personnages qui le possèdent, dans l'ordre `order`"""
+    np = _require_numpy()
+    features = np.unpackbits(packed, axis=1, count=n_features).astype(bool)[order]
+    columns = [j for j, token in enumerate(vocabulary) if token.startswith(prefix)]
+    token_pos, char_pos = np.nonzero(features[:, columns].T)
+    lists = {vocabulary[j][len(prefix):]: [] for j in columns}
+    for t, c in zip(token_pos.tolist(), char_pos.tolist()):
+        lists[vocabulary[columns[t]][len(prefix):]].append(int(order[c]))
+    return lists
+
+
+def build_tables(characters, catalog=(), k=DEFAULT_K, metric="jaccard"):
+    """Tables de recommandation sérialisables en JSON"""
+    np = _require_numpy()
+    ids = [character_id(c, i) for i, c in enumerate(characters)]
+    packed, vocabulary = encode_features(characters, catalog)
+    indices, scores = top_k_neighbours(packed, len(vocabulary), k=k, metric=metric)
+
+    similar = {}
+    for i, own_id in enumerate(ids):
+        keep = scores[i] > 0
+        similar[own_id] = [
+            [ids[j], round(float(s), 3)] for j, s in zip(indices[i][keep], scores[i][keep])
+        ]
+
+    # Les listes inversées sont triées par popularité décroissante
+    popularity = np.asarray([c.get("popularity") or 0 for c in characters])
+    order = np.argsort(-popularity, kind="stable")
+    items = inverted_lists(packed, len(vocabulary), vocabulary, "catalog:", order)
+
+    return {
+        "metric": metric,
+        "k": k,
+        "similar": similar,
+        "itemLikers": {item_id: [ids[i] for i in rows] for item_id, rows in items.items()},
+    }
+
+
+def main(k=DEFAULT_K, metric="jaccard"):
+    """Fonction principale"""
+    print("🔗 Calcul des tables de recommandation...")
+    with open(CHARACTERS_DATA_FILE, "r", encoding="utf-8") as f:
+        characters = json.load(f).get("characters", [])
+
+    tables = build_tables(characters, load_item_catalog(), k=k, metric=metric)
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        json.dump(tables, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+    print(f"  ✓ {len(tables['similar'])} personnages, {len(tables['itemLikers'])} objets du catalogue aimés")
+    print(f"\n✅ Tables sauvegardées: {OUTPUT_FILE}")
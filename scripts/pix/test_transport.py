@@ -0,0 +1,104 @@
+"""
+Vérification aller-retour du format d'archive (record puis replay)
+
+Exécution (depuis scripts/):
+    python3 -m unittest pix.test_transport
+"""
+
+import http.server
+import tempfile
+import threading
+import unittest
+import urllib.error
+
+from pix.transport import Archive, Response, Transport, _decode_record, _encode_record
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serveur local: /ok -> 200, tout le reste -> 404"""
+
+    def _respond(self, with_body):
+        status, body = (200, b"bonjour \xc3\xa9\r\n\r\nfin") if self.path == "/ok" else (404, b"introuvable")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def do_HEAD(self):
+        self._respond(False)
+
+    def log_message(self, *args):
+        pass
+
+
+class RecordFormatTest(unittest.TestCase):
+    def test_encode_decode_round_trip(self):
+        original = Response("https://example.org/a?b=1", 200, [("Content-Type", "image/png"), ("X-Test", "a: b")], b"\x89PNG\r\n\r\n\x00")
+        decoded = _decode_record(_encode_record("GET", original))
+        self.assertEqual(decoded.url, original.url)
+        self.assertEqual(decoded.status, 200)
+        self.assertEqual(decoded.headers, original.headers)
+        self.assertEqual(decoded.body, original.body)
+
+    def test_flush_merges_and_replaces_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = Archive(tmp)
+            archive.put("GET", Response("https://example.org/1", 200, [], b"un"))
+            archive.put("GET", Response("https://example.org/2", 200, [], b"deux"))
+            archive.flush()
+
+            archive.put("GET", Response("https://example.org/2", 200, [], b"deux (v2)"))
+            archive.put("GET", Response("https://example.org/3", 404, [], b""))
+            archive.flush()
+            archive.close()
+
+            reopened = Archive(tmp)
+            self.assertEqual(reopened.get("GET", "https://example.org/1").body, b"un")
+            self.assertEqual(reopened.get("GET", "https://example.org/2").body, b"deux (v2)")
+            self.assertEqual(reopened.get("GET", "https://example.org/3").status, 404)
+            self.assertIsNone(reopened.get("HEAD", "https://example.org/1"))
+            self.assertIsNone(reopened.get("GET", "https://example.org/absent"))
+            reopened.close()
+
+
+class RecordReplayTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_record_then_replay(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            recorder = Transport("record", tmp)
+            live = recorder.fetch(self.base + "/ok")
+            head = recorder.fetch(self.base + "/ok", method="HEAD")
+            with self.assertRaises(urllib.error.HTTPError):
+                recorder.fetch(self.base + "/missing")
+            recorder.close()
+
+            replayer = Transport("replay", tmp)
+            replayed = replayer.fetch(self.base + "/ok")
+            self.assertEqual(replayed.body, live.body)
+            self.assertEqual(replayed.header("content-type"), "text/plain; charset=utf-8")
+            self.assertEqual(replayer.fetch(self.base + "/ok", method="HEAD").status, head.status)
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                replayer.fetch(self.base + "/missing")
+            self.assertEqual(ctx.exception.code, 404)
+            with self.assertRaises(urllib.error.URLError):
+                replayer.fetch(self.base + "/never-recorded")
+            replayer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
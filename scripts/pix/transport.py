@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Transport HTTP enfichable pour les scripts du pipeline (live / record / replay)
+
+Le mode est choisi par la variable d'environnement PIX_HTTP_MODE:
+  - live   : requêtes réseau directes (par défaut)
+  - record : requêtes réseau + enregistrement des réponses dans l'archive
+  - replay : réponses servies depuis l'archive, aucun accès réseau
+
+L'archive (PIX_HTTP_ARCHIVE, par défaut data/http-archive/) contient:
+  - records.warc.gz : un membre gzip par réponse, au format proche du WARC
+  - index.bin       : entrées triées (sha1 de "METHODE URL", offset, longueur)
+                      lues via mmap et recherche dichotomique en mode replay
+"""
+
+import atexit
+import gzip
+import hashlib
+import mmap
+import os
+import struct
+import time
+import urllib.error
+from pathlib import Path
+
+from pix.config import HTTP_ARCHIVE_DIR
+
+RECORDS_NAME = "records.warc.gz"
+INDEX_NAME = "index.bin"
+
+MODES = ("live", "record", "replay")
+
+# Entrée d'index: clé sha1 (20 octets), offset (u64), longueur (u32)
+INDEX_ENTRY = struct.Struct(">20sQI")
+
+
+class Response:
+    """Réponse HTTP minimale, identique en live et en replay"""
+
+    def __init__(self, url, status, headers, body):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def text(self, encoding="utf-8", errors="strict"):
+        return self.body.decode(encoding, errors=errors)
+
+    def header(self, name, default=None):
+        """Valeur d'un en-tête HTTP (nom insensible à la casse)"""
+        for key, value in self.headers:
+            if key.lower() == name.lower():
+                return value
+        return default
+
+
+def request_key(method, url):
+    """Clé d'index d'une requête"""
+    return hashlib.sha1(f"{method.upper()} {url}".encode("utf-8")).digest()
+
+
+def _http_error(response):
+    """Reconstruire l'HTTPError d'une réponse enregistrée"""
+    from email.message import Message
+
+    headers = Message()
+    for name, value in response.headers:
+        headers[name] = value
+    return urllib.error.HTTPError(response.url, response.status, f"HTTP {response.status}", headers, None)
+
+
+def _encode_record(method, response):
+    """Sérialiser une réponse en bloc WARC-like (en-têtes WARC, en-têtes HTTP, corps)"""
+    http_head = [f"HTTP/1.1 {response.status}"]
+    http_head += [f"{name}: {value}" for name, value in response.headers]
+    http_block = ("\r\n".join(http_head) + "\r\n\r\n").encode("utf-8") + response.body
+
+    warc_head = [
+        "WARC/1.0",
+        "WARC-Type: response",
+        f"WARC-Target-URI: {response.url}",
+        f"WARC-Method: {method.upper()}",
+        f"Content-Length: {len(http_block)}",
+    ]
+    return ("\r\n".join(warc_head) + "\r\n\r\n").encode("utf-8") + http_block
+
+
+def _decode_record(data):
+    """Inverse de _encode_record"""
+    warc_head, http_block = data.split(b"\r\n\r\n", 1)
+    url = None
+    for line in warc_head.decode("utf-8").split("\r\n")[1:]:
+        name, _, value = line.partition(": ")
+        if name == "WARC-Target-URI":
+            url = value
+
+    http_head, body = http_block.split(b"\r\n\r\n", 1)
+    lines = http_head.decode("utf-8").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    headers = [tuple(line.split(": ", 1)) for line in lines[1:]]
+    return Response(url, status, headers, body)
+
+
+class Archive:
+    """Archive compressée de réponses HTTP avec index trié"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.records_path = self.path / RECORDS_NAME
+        self.index_path = self.path / INDEX_NAME
+        self._index = None
+        self._index_file = None
+        self._records = None
+        self._pending = {}
+
+    # --- Lecture (replay) ---
+
+    def _open_index(self):
+        if self._index is not None:
+            return
+        if not self.index_path.exists() or self.index_path.stat().st_size == 0:
+            self._index = b""
+            return
+        self._index_file = open(self.index_path, "rb")
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _lookup(self, key):
+        """Recherche dichotomique de la clé dans l'index mmap"""
+        self._open_index()
+        size = INDEX_ENTRY.size
+        lo, hi = 0, len(self._index) // size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry_key = self._index[mid * size:mid * size + 20]
+            if entry_key < key:
+                lo = mid + 1
+            elif entry_key > key:
+                hi = mid
+            else:
+                _, offset, length = INDEX_ENTRY.unpack_from(self._index, mid * size)
+                return offset, length
+        return None
+
+    def get(self, method, url):
+        """Réponse enregistrée pour (méthode, url), ou None"""
+        location = self._lookup(request_key(method, url))
+        if location is None:
+            return None
+        offset, length = location
+        if self._records is None:
+            self._records = open(self.records_path, "rb")
+        self._records.seek(offset)
+        return _decode_record(gzip.decompress(self._records.read(length)))
+
+    # --- Écriture (record) ---
+
+    def put(self, method, response):
+        """Ajouter une réponse à la fin de l'archive"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        member = gzip.compress(_encode_record(method, response), mtime=0)
+        with open(self.records_path, "ab") as f:
+            offset = f.tell()
+            f.write(member)
+        self._pending[request_key(method, response.url)] = (offset, len(member))
+
+    def flush(self):
+        """Réécrire l'index trié (les nouvelles entrées remplacent les anciennes)"""
+        if not self._pending:
+            return
+        self._open_index()
+        size = INDEX_ENTRY.size
+        entries = {}
+        for i in range(len(self._index) // size):
+            key, offset, length = INDEX_ENTRY.unpack_from(self._index, i * size)
+            entries[key] = (offset, length)
+        entries.update(self._pending)
+        self.close()
+
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            for key in sorted(entries):
+                f.write(INDEX_ENTRY.pack(key, *entries[key]))
+        os.replace(tmp_path, self.index_path)
+        self._pending = {}
+
+    def close(self):
+        if isinstance(self._index, mmap.mmap):
+            self._index.close()
+        if self._index_file is not None:
+            self._index_file.close()
+        if self._records is not None:
+            self._records.close()
+        self._index = self._index_file = self._records = None
+
+
+def _live_fetch(url, headers, timeout, method):
+    # Import différé: urllib.request charge http.client et ssl
+    import urllib.request
+
+    req = urllib.request.Request(url, headers=headers or {}, method=method)
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        return Response(url, response.status, list(response.headers.items()), response.read())
+
+
+class Transport:
+    """Point d'entrée unique des requêtes HTTP du pipeline"""
+
+    def __init__(self, mode="live", archive=None):
+        if mode not in MODES:
+            raise ValueError(f"Mode de transport inconnu: {mode} (attendu: {', '.join(MODES)})")
+        self.mode = mode
+        self.archive = Archive(archive or HTTP_ARCHIVE_DIR) if mode != "live" else None
+
+    def fetch(self, url, headers=None, timeout=10, method="GET"):
+        """Effectuer une requête; lève urllib.error.HTTPError / URLError comme urlopen"""
+        if self.mode == "replay":
+            response = self.archive.get(method, url)
+            if response is None:
+                raise urllib.error.URLError(f"absent de l'archive: {method} {url}")
+        else:
+            try:
+                response = _live_fetch(url, headers, timeout, method)
+            except urllib.error.HTTPError as e:
+                response = Response(url, e.code, list(e.headers.items()) if e.headers else [], e.read() if e.fp else b"")
+            if self.mode == "record":
+                self.archive.put(method, response)
+
+        if response.status >= 400:
+            raise _http_error(response)
+        return response
+
+    def pause(self, seconds):
+        """Politesse envers les serveurs distants, inutile en replay"""
+        if self.mode != "replay":
+            time.sleep(seconds)
+
+    def close(self):
+        if self.archive is not None:
+            self.archive.flush()
+            self.archive.close()
+
+
+_default = None
+
+
+def get_transport():
+    """Transport partagé, configuré par PIX_HTTP_MODE / PIX_HTTP_ARCHIVE"""
+    global _default
+    if _default is None:
+        _default = Transport(
+            os.environ.get("PIX_HTTP_MODE", "live"),
+            os.environ.get("PIX_HTTP_ARCHIVE"),
+        )
+        atexit.register(_default.close)
+    return _default
+
+
+def fetch(url, headers=None, timeout=10, method="GET"):
+    """Raccourci vers get_transport().fetch"""
+    return get_transport().fetch(url, headers=headers, timeout=timeout, method=method)
+
+
+def pause(seconds):
+    """Raccourci vers get_transport().pause"""
+    get_transport().pause(seconds)
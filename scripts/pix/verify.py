@@ -0,0 +1,173 @@
+"""
+Vérification d'intégrité des images de personnages avant leur intégration dans l'app
+
+Pour chaque fichier de assets/images/characters (en parallèle, pool de processus):
+  - signature (magic bytes) cohérente avec l'extension, pas de page HTML
+  - décodage complet de l'image (détecte les fichiers tronqués)
+  - dimensions dans les bornes
+  - sha256 comparé à celui du manifeste (data/character-images-manifest.json)
+
+Les résultats sont mis en cache (VERIFY_CACHE_FILE) par fichier, avec la clé
+mtime + taille: une nouvelle exécution ne relit que les fichiers nouveaux ou modifiés.
+
+Dépendances: Pillow (avec support WebP)
+"""
+
+import hashlib
+import io
+import json
+import os
+
+from pix import manifest
+from pix.config import CHARACTERS_DIR, ROOT_DIR
+
+VERIFY_CACHE_FILE = ROOT_DIR / ".cache" / "verify-character-images.json"
+# Bornes raisonnables pour un sprite de personnage
+MIN_DIMENSION = 8
+MAX_DIMENSION = 4096
+
+# Extension -> format détecté par detect_format
+EXPECTED_FORMATS = {
+    ".png": "png",
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+    ".gif": "gif",
+    ".webp": "webp",
+}
+
+
+def detect_format(header):
+    """Format d'après les premiers octets du fichier, ou None"""
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    if header.lstrip().startswith(b"<"):
+        return "html"
+    return None
+
+
+def check_file(path):
+    """Vérifier un fichier; retourne un dict sérialisable (pas d'exception)"""
+    result = {"file": os.path.basename(path), "errors": []}
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        result["errors"].append(f"lecture impossible: {e}")
+        return result
+
+    result["sha256"] = hashlib.sha256(data).hexdigest()
+    detected = detect_format(data[:32])
+    expected = EXPECTED_FORMATS.get(os.path.splitext(path)[1].lower())
+    result["format"] = detected
+
+    if detected == "html":
+        result["errors"].append("contenu HTML au lieu d'une image")
+        return result
+    if detected is None:
+        result["errors"].append("signature d'image inconnue")
+        return result
+    if expected and detected != expected:
+        result["errors"].append(f"extension {expected} mais contenu {detected}")
+
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as img:
+            img.load()
+            width, height = img.size
+    except ImportError as e:
+        result["errors"].append(f"dépendance manquante ({e.name}): pip install Pillow")
+        return result
+    except Exception as e:
+        result["errors"].append(f"décodage impossible: {type(e).__name__}: {e}")
+        return result
+
+    result["width"], result["height"] = width, height
+    if not (MIN_DIMENSION <= width <= MAX_DIMENSION and MIN_DIMENSION <= height <= MAX_DIMENSION):
+        result["errors"].append(f"dimensions hors bornes: {width}x{height}")
+    return result
+
+
+def load_cache(path=VERIFY_CACHE_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache, path=VERIFY_CACHE_FILE):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def verify_images(directory=CHARACTERS_DIR, workers=None, use_cache=True):
+    """Résultats de vérification par nom de fichier, et nombre de fichiers réellement relus"""
+    paths = manifest.list_character_images(directory)
+    cache = load_cache() if use_cache else {}
+
+    results, pending = {}, []
+    for path in paths:
+        stat = path.stat()
+        key = f"{stat.st_mtime_ns}:{stat.st_size}"
+        cached = cache.get(path.name)
+        if cached and cached.get("key") == key:
+            results[path.name] = cached["result"]
+        else:
+            pending.append((path, key))
+
+    if pending:
+        from concurrent.futures import ProcessPoolExecutor
+
+        files = [str(path) for path, _ in pending]
+        if len(files) == 1 or workers == 1:
+            checked = [check_file(f) for f in files]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                checked = list(pool.map(check_file, files, chunksize=8))
+        for (path, key), result in zip(pending, checked):
+            results[path.name] = result
+            cache[path.name] = {"key": key, "result": result}
+
+    # Oublier les fichiers supprimés
+    cache = {name: entry for name, entry in cache.items() if name in results}
+    save_cache(cache)
+
+    # Comparaison au manifeste: toujours refaite, le manifeste peut changer sans toucher aux images
+    expected = manifest.load_manifest()
+    for name, result in results.items():
+        entry = expected.get(name)
+        result["warnings"] = []
+        if entry is None:
+            result["warnings"].append("absent du manifeste (pix index --write)")
+        elif entry.get("sha256") and result.get("sha256") and entry["sha256"] != result["sha256"]:
+            result["errors"] = result["errors"] + ["sha256 différent du manifeste"]
+    return results, len(pending)
+
+
+def main(workers=None, use_cache=True):
+    """Fonction principale; retourne le code de sortie (1 si une image est invalide)"""
+    print("🔎 Vérification des images de personnages...")
+    results, checked = verify_images(workers=workers, use_cache=use_cache)
+
+    failed = 0
+    for name, result in results.items():
+        if result["errors"]:
+            failed += 1
+            print(f"  ✗ {name}: {'; '.join(result['errors'])}")
+        for warning in result["warnings"]:
+            print(f"  ⚠ {name}: {warning}")
+
+    print(f"\n📊 {len(results)} images, {checked} vérifiée(s), {len(results) - checked} depuis le cache")
+    if failed:
+        print(f"❌ {failed} image(s) invalide(s)")
+        return 1
+    print("✅ Toutes les images sont valides")
+    return 0